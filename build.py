@@ -0,0 +1,83 @@
+"""
+Poetry build script that compiles the optional C extension with the 3D vector
+kernels of vec3d.math. If Cython or a C compiler is not available the extension
+is skipped, and the library falls back to its pure Python implementation.
+
+To build the extension in place for development, run: python build.py
+That build is tuned for the CPU of the current machine with -march=native. The
+package builds only use it when the VEC3D_NATIVE_BUILD environment variable is
+set to 1, as the resulting wheels could crash on other CPUs.
+"""
+import logging
+import os
+
+from setuptools import Distribution, Extension
+from setuptools.command.build_ext import build_ext
+
+logger = logging.getLogger(__name__)
+
+
+def make_extensions(native: bool) -> list[Extension]:
+    """Returns the C extensions to build, tuned for the CPU of the build
+    machine if native is True."""
+    compile_args = ["-O3"]
+    if native:
+        compile_args.append("-march=native")
+
+    return [
+        Extension(
+            "vec3d.math._math_c",
+            ["vec3d/math/_math_c.pyx"],
+            depends=["vec3d/math/_math_simd.h"],
+            extra_compile_args=compile_args,
+        ),
+    ]
+
+
+class OptionalBuildExt(build_ext):
+    """build_ext command that doesn't fail the build when the extension
+    cannot be compiled."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            logger.warning("Skipping optional C extension: %s", ex)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            logger.warning("Skipping optional C extension %s: %s", ext.name, ex)
+
+
+def build(setup_kwargs, native=None):
+    """Adds the optional C extension to the setup arguments generated by
+    Poetry."""
+    if native is None:
+        native = os.environ.get("VEC3D_NATIVE_BUILD") == "1"
+
+    try:
+        from Cython.Build import (  # pylint: disable=import-outside-toplevel
+            cythonize,
+        )
+    except ImportError:
+        logger.warning("Cython not found: skipping optional C extension")
+        return
+
+    setup_kwargs.update(
+        {
+            "ext_modules": cythonize(make_extensions(native)),
+            "cmdclass": {"build_ext": OptionalBuildExt},
+        }
+    )
+
+
+if __name__ == "__main__":
+    kwargs = {}
+    build(kwargs, native=True)
+    distribution = Distribution(kwargs)
+    command = distribution.get_command_obj("build_ext")
+    command.inplace = True
+    command.ensure_finalized()
+    command.run()
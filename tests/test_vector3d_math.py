@@ -1,8 +1,30 @@
 """Testing vector3d_math functions"""
 import unittest
 from collections import namedtuple
+from math import isnan, pi
 
-from vec3d.math import add, dot, linear_combination, subtract
+import numpy as np
+
+from vec3d.math import (
+    Vec3,
+    add,
+    add_batched,
+    angle_between,
+    cos_angle_between,
+    cross,
+    cross_batched,
+    dot,
+    dot_batched,
+    length,
+    length_batched,
+    linear_combination,
+    scale,
+    subtract,
+    to_degrees_batched,
+    to_radians_batched,
+    unit,
+    unit_batched,
+)
 
 
 class TestVector3DMath(unittest.TestCase):
@@ -39,10 +61,24 @@ class TestVector3DMath(unittest.TestCase):
                 ],
                 expected=(35, 40, 45),
             ),
+            "4 10D vectors": SubTest(
+                vectors=[
+                    (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+                    (11, 12, 13, 14, 15, 16, 17, 18, 19, 20),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (0.5, 0, 0, 0, 0, 0, 0, 0, 0, -0.5),
+                ],
+                expected=(13.5, 15, 17, 19, 21, 23, 25, 27, 29, 30.5),
+            ),
+            "40 3D vectors": SubTest(
+                vectors=[(i, 2 * i, -i) for i in range(40)],
+                expected=(780, 1560, -780),
+            ),
         }
 
         for subtest_name, subtest_data in subtests.items():
             got = add(*subtest_data.vectors)
+            self.assertIsInstance(got, tuple, f"{subtest_name}: not a tuple")
             self.assertEqual(
                 got,
                 subtest_data.expected,
@@ -81,6 +117,37 @@ class TestVector3DMath(unittest.TestCase):
             ):
                 add(*subtest_data.vectors)
 
+    def test_add_batched_happy_path(self):
+        SubTest = namedtuple("Subtest", ["x", "expected"])
+
+        subtests = {
+            "Single 3D vector": SubTest(x=[(1, 2, 3)], expected=(1, 2, 3)),
+            "5 3D vectors": SubTest(
+                x=[
+                    (1, 2, 3),
+                    (4, 5, 6),
+                    (7, 8, 9),
+                    (10, 11, 12),
+                    (13, 14, 15),
+                ],
+                expected=(35, 40, 45),
+            ),
+            "3 2D vectors": SubTest(
+                x=[(1, 2), (3, 4), (5, 6.5)], expected=(9, 12.5)
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = add_batched(subtest_data.x)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
     def test_subtract_happy_path(self):
         SubTest = namedtuple("Subtest", ["vectors", "expected"])
 
@@ -181,6 +248,378 @@ class TestVector3DMath(unittest.TestCase):
             ):
                 dot(subtest_data.u, subtest_data.v)
 
+    def test_dot_non_finite(self):
+        SubTest = namedtuple("Subtest", ["u", "v", "expected"])
+        nan, inf = float("nan"), float("inf")
+
+        subtests = {
+            "3D vectors with nan": SubTest(
+                u=(nan, 1, 1), v=(1, 1, 1), expected=nan
+            ),
+            "3D vectors with inf * 0": SubTest(
+                u=(inf, 1, 1), v=(0, 1, 1), expected=nan
+            ),
+            "3D vectors with inf": SubTest(
+                u=(inf, 1, 1), v=(1, 1, 1), expected=inf
+            ),
+            "4D vectors with nan": SubTest(
+                u=(1, 1, 1, nan), v=(1, 1, 1, 1), expected=nan
+            ),
+            "4D vectors with inf * 0": SubTest(
+                u=(1, 1, 1, inf), v=(1, 1, 1, 0), expected=nan
+            ),
+            "10D vectors with nan": SubTest(
+                u=(nan,) + (1,) * 9, v=(1,) * 10, expected=nan
+            ),
+            "10D vectors with inf * 0": SubTest(
+                u=(inf,) + (1,) * 9, v=(0,) + (1,) * 9, expected=nan
+            ),
+            "10D vectors with inf": SubTest(
+                u=(1,) * 9 + (-inf,), v=(1,) * 10, expected=-inf
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = dot(subtest_data.u, subtest_data.v)
+            np.testing.assert_equal(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_angle_between_happy_path(self):
+        SubTest = namedtuple("Subtest", ["u", "v", "expected"])
+
+        subtests = {
+            "Perpendicular vectors": SubTest(
+                u=(1, 0, 0), v=(0, 1, 0), expected=pi / 2
+            ),
+            "Opposite vectors": SubTest(
+                u=(1, 2, 3), v=(-2, -4, -6), expected=pi
+            ),
+            "45 degrees 2D vectors": SubTest(
+                u=(1, 0), v=(1, 1), expected=pi / 4
+            ),
+            "Parallel vectors with rounding errors": SubTest(
+                u=(0.8444218515250481, 0.7579544029403025, 0.420571580830845),
+                v=(
+                    2.5891675029296337 * 0.8444218515250481,
+                    2.5891675029296337 * 0.7579544029403025,
+                    2.5891675029296337 * 0.420571580830845,
+                ),
+                expected=0,
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = angle_between(subtest_data.u, subtest_data.v)
+            self.assertAlmostEqual(
+                got,
+                subtest_data.expected,
+                msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_angle_between_nan(self):
+        got = angle_between((float("nan"), 0, 0), (1, 0, 0))
+        self.assertTrue(isnan(got), f"expected nan but got {got}")
+
+    def test_cos_angle_between_happy_path(self):
+        SubTest = namedtuple("Subtest", ["u", "v", "expected"])
+
+        subtests = {
+            "Perpendicular vectors": SubTest(
+                u=(1, 0, 0), v=(0, 1, 0), expected=0
+            ),
+            "Opposite vectors": SubTest(
+                u=(1, 2, 3), v=(-2, -4, -6), expected=-1
+            ),
+            "Parallel vectors": SubTest(u=(1, 2, 3), v=(2, 4, 6), expected=1),
+            "60 degrees 3D vectors": SubTest(
+                u=(1, 1, 0), v=(0, 1, 1), expected=0.5
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = cos_angle_between(subtest_data.u, subtest_data.v)
+            self.assertAlmostEqual(
+                got,
+                subtest_data.expected,
+                msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_dot_batched_happy_path(self):
+        SubTest = namedtuple("Subtest", ["u", "v", "expected"])
+
+        subtests = {
+            "Single pair of 3D vectors": SubTest(
+                u=[(1, 2, 3)], v=[(4, 5, 6)], expected=[32]
+            ),
+            "3 pairs of 3D vectors": SubTest(
+                u=[(1, 2, 3), (1, 0, 0), (-1, 2, 0.5)],
+                v=[(4, 5, 6), (0, 1, 0), (2, 2, 2)],
+                expected=[32, 0, 3],
+            ),
+            "2 pairs of 10D vectors": SubTest(
+                u=[
+                    (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                ],
+                v=[
+                    (11, 12, 13, 14, 15, 16, 17, 18, 19, 20),
+                    (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+                ],
+                expected=[935, 55],
+            ),
+            "Batch of batches of 3D vectors": SubTest(
+                u=[[(1, 2, 3), (1, 0, 0)], [(0, 1, 0), (2, 2, 2)]],
+                v=[[(4, 5, 6), (0, 1, 0)], [(0, 1, 0), (1, 1, 1)]],
+                expected=[[32, 0], [1, 6]],
+            ),
+            "3D vectors and a single direction": SubTest(
+                u=[(1, 2, 3), (1, 0, 0), (-1, 2, 0.5)],
+                v=(1, 2, 3),
+                expected=[14, 1, 4.5],
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = dot_batched(subtest_data.u, subtest_data.v)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_dot_batched_unhappy_path(self):
+        SubTest = namedtuple("Subtest", ["u", "v", "expected_ex"])
+
+        subtests = {
+            "First vectors longer": SubTest(
+                u=[(1, 2, 3)], v=[(4, 5)], expected_ex=TypeError
+            ),
+            "Batches that cannot be broadcast": SubTest(
+                u=[(1, 2, 3), (1, 2, 3)],
+                v=[(4, 5, 6), (7, 8, 9), (1, 1, 1)],
+                expected_ex=ValueError,
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            with self.assertRaises(
+                subtest_data.expected_ex, msg=f"Subtest '{subtest_name}' failed"
+            ):
+                dot_batched(subtest_data.u, subtest_data.v)
+
+    def test_length_happy_path(self):
+        SubTest = namedtuple("Subtest", ["v", "expected"])
+
+        subtests = {
+            "2D vector": SubTest(v=(3, 4), expected=5),
+            "3D vector": SubTest(v=(2, 3, 6), expected=7),
+            "Zero vector": SubTest(v=(0, 0, 0), expected=0),
+            "3D vector with large coordinates": SubTest(
+                v=(2e200, 3e200, 6e200), expected=7e200
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = length(subtest_data.v)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_length_batched_happy_path(self):
+        SubTest = namedtuple("Subtest", ["x", "expected"])
+
+        subtests = {
+            "Single 3D vector": SubTest(x=[(2, 3, 6)], expected=[7]),
+            "3 3D vectors": SubTest(
+                x=[(2, 3, 6), (0, 0, 0), (-1, 0, 0)], expected=[7, 0, 1]
+            ),
+            "2 2D vectors": SubTest(x=[(3, 4), (5, 12)], expected=[5, 13]),
+            "Large integer coordinates": SubTest(
+                x=[(2**32, 0, 0), (0, 3 * 2**32, 4 * 2**32)],
+                expected=[2**32, 5 * 2**32],
+            ),
+            "Large and small coordinates": SubTest(
+                x=[(1e200, 1e200, 1e200), (3e-200, 4e-200, 0), (2, 3, 6)],
+                expected=[3**0.5 * 1e200, 5e-200, 7],
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = length_batched(subtest_data.x)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_unit_happy_path(self):
+        SubTest = namedtuple("Subtest", ["v", "expected"])
+
+        subtests = {
+            "2D vector": SubTest(v=(3, 4), expected=(3 / 5, 4 / 5)),
+            "3D vector": SubTest(v=(2, 3, 6), expected=(2 / 7, 3 / 7, 6 / 7)),
+            "4D vector": SubTest(
+                v=(1, 1, 1, 1), expected=(0.5, 0.5, 0.5, 0.5)
+            ),
+            "3D vector with large coordinates": SubTest(
+                v=(1e200, 1e200, 1e200),
+                expected=(3**-0.5, 3**-0.5, 3**-0.5),
+            ),
+            "3D vector with small coordinates": SubTest(
+                v=(2e-200, 3e-200, 6e-200),
+                expected=(2 / 7, 3 / 7, 6 / 7),
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = unit(subtest_data.v)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_unit_unhappy_path(self):
+        with self.assertRaises(ZeroDivisionError):
+            unit((0, 0, 0))
+
+    def test_unit_non_finite(self):
+        SubTest = namedtuple("Subtest", ["v", "expected"])
+        nan, inf = float("nan"), float("inf")
+
+        subtests = {
+            "3D vector with nan": SubTest(v=(nan, 0, 0), expected=(nan,) * 3),
+            "3D vector with inf": SubTest(v=(inf, 0, 1), expected=(nan, 0, 0)),
+            "2D vector with nan": SubTest(v=(nan, 1), expected=(nan, nan)),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = unit(subtest_data.v)
+            np.testing.assert_equal(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_unit_batched_happy_path(self):
+        SubTest = namedtuple("Subtest", ["x", "expected"])
+
+        subtests = {
+            "Single 3D vector": SubTest(
+                x=[(2, 3, 6)], expected=[(2 / 7, 3 / 7, 6 / 7)]
+            ),
+            "3 3D vectors": SubTest(
+                x=[(2, 3, 6), (0, 0, 5), (-1, 0, 0)],
+                expected=[(2 / 7, 3 / 7, 6 / 7), (0, 0, 1), (-1, 0, 0)],
+            ),
+            "Large integer coordinates": SubTest(
+                x=[(2**32, 0, 0)], expected=[(1, 0, 0)]
+            ),
+            "Large and small coordinates": SubTest(
+                x=[(1e200, 1e200, 1e200), (3e-200, 4e-200, 0)],
+                expected=[(3**-0.5, 3**-0.5, 3**-0.5), (0.6, 0.8, 0)],
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = unit_batched(subtest_data.x)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_cross_unhappy_path(self):
+        SubTest = namedtuple("Subtest", ["u", "v", "expected_ex"])
+
+        subtests = {
+            "No args provided": SubTest(u=None, v=None, expected_ex=TypeError),
+            "2D vectors": SubTest(u=(1, 2), v=(3, 4), expected_ex=TypeError),
+            "4D vectors": SubTest(
+                u=(1, 2, 3, 4), v=(1, 2, 3, 4), expected_ex=TypeError
+            ),
+            "First vector longer": SubTest(
+                u=(1, 2, 3, 4), v=(4, 5, 6), expected_ex=TypeError
+            ),
+            "Second vector shorter": SubTest(
+                u=(1, 2, 3), v=(4, 5), expected_ex=TypeError
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            with self.assertRaises(
+                subtest_data.expected_ex, msg=f"Subtest '{subtest_name}' failed"
+            ):
+                cross(subtest_data.u, subtest_data.v)
+
+    def test_unit_batched_unhappy_path(self):
+        with self.assertRaises(ZeroDivisionError):
+            unit_batched([(2, 3, 6), (0, 0, 0)])
+
+    def test_cross_batched_happy_path(self):
+        SubTest = namedtuple("Subtest", ["a", "b", "expected"])
+
+        subtests = {
+            "Single pair of 3D vectors": SubTest(
+                a=[(1, 0, 0)], b=[(0, 1, 0)], expected=[(0, 0, 1)]
+            ),
+            "3 pairs of 3D vectors": SubTest(
+                a=[(1, 0, 0), (3, -2, 2), (1, 2, 3)],
+                b=[(0, 1, 0), (2, 4, 3), (2, 4, 6)],
+                expected=[(0, 0, 1), (-14, -5, 16), (0, 0, 0)],
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = cross_batched(subtest_data.a, subtest_data.b)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_angle_conversions_batched_happy_path(self):
+        degrees = [0, 45, 90, 180, -360]
+        radians = [0, np.pi / 4, np.pi / 2, np.pi, -2 * np.pi]
+
+        np.testing.assert_allclose(to_radians_batched(degrees), radians)
+        np.testing.assert_allclose(to_degrees_batched(radians), degrees)
+
     def test_linear_combination_happy_path(self):
         SubTest = namedtuple("Subtest", ["scalars", "vectors", "expected"])
 
@@ -203,12 +642,23 @@ class TestVector3DMath(unittest.TestCase):
                 ],
                 expected=(35, 40, 45, 50, 55, 60, 65, 70, 75, 80),
             ),
+            "4 scalars and 4 3D vectors": SubTest(
+                scalars=[1, 2, 3, 0.5],
+                vectors=[(1, 2, 3), (4, 5, 6), (7, 8, 9), (2, 0, -2)],
+                expected=(31, 36, 41),
+            ),
+            "9 scalars and 9 3D vectors": SubTest(
+                scalars=[1, 1, 1, 1, 1, 1, 1, 1, 0.5],
+                vectors=[(1, 2, 3)] * 8 + [(2, 0, -2)],
+                expected=(9, 16, 23),
+            ),
         }
 
         for subtest_name, subtest_data in subtests.items():
             got = linear_combination(
                 subtest_data.scalars, *subtest_data.vectors
             )
+            self.assertIsInstance(got, tuple, f"{subtest_name}: not a tuple")
             self.assertEqual(
                 got,
                 subtest_data.expected,
@@ -282,6 +732,74 @@ class TestVector3DMath(unittest.TestCase):
             ):
                 linear_combination(subtest_data.scalars, *subtest_data.vectors)
 
+    def test_vec3(self):
+        u = Vec3(1, 2, 3)
+        v = Vec3(4, 5, 6)
+
+        self.assertEqual(u + v, Vec3(5, 7, 9))
+        self.assertEqual(u - v, Vec3(-3, -3, -3))
+        self.assertEqual(2 * u, Vec3(2, 4, 6))
+        self.assertEqual(u * 2, Vec3(2, 4, 6))
+        self.assertEqual(u.dot(v), 32)
+        self.assertEqual(u.cross(v), Vec3(-3, 6, -3))
+        self.assertAlmostEqual(Vec3(2, 3, 6).length(), 7)
+        with self.assertRaises(AttributeError):
+            u.x = 0
+        self.assertEqual(repr(u), "Vec3(x=1.0, y=2.0, z=3.0)")
+        self.assertEqual(hash(u), hash(Vec3(1.0, 2.0, 3.0)))
+        self.assertEqual((u[0], u[-1], u[1:]), (1, 3, (2, 3)))
+        with self.assertRaises(IndexError):
+            u[3]  # pylint: disable=pointless-statement
+
+    def test_vec3_unsupported_operands(self):
+        u = Vec3(1, 2, 3)
+
+        self.assertNotEqual(u, (1, 2, 3))
+        with self.assertRaises(TypeError):
+            u + (1, 2, 3)  # pylint: disable=pointless-statement
+        with self.assertRaises(TypeError):
+            u - (1, 2, 3)  # pylint: disable=pointless-statement
+        with self.assertRaises(TypeError):
+            u * u  # pylint: disable=pointless-statement
+        with self.assertRaises(TypeError):
+            "2" * u  # pylint: disable=pointless-statement
+
+    def test_vec3_as_tuple(self):
+        u = Vec3(1, 2, 3)
+        v = Vec3(4, 5, 6)
+
+        self.assertEqual(tuple(u), (1, 2, 3))
+        self.assertEqual(add(u, v), (5, 7, 9))
+        self.assertEqual(add(u, v, u, v), (10, 14, 18))
+        self.assertEqual(subtract(u, v), (-3, -3, -3))
+        self.assertEqual(dot(u, (4, 5, 6)), 32)
+        self.assertEqual(cross(u, v), (-3, 6, -3))
+        self.assertAlmostEqual(length(Vec3(2, 3, 6)), 7)
+        self.assertEqual(linear_combination([1, 2], u, v), (9, 12, 15))
+
+    def test_int_inputs_are_coerced_to_float(self):
+        SubTest = namedtuple("SubTest", ["func", "args"])
+
+        subtests = {
+            "add 3D": SubTest(func=add, args=[(1, 2, 3), (4, 5, 6)]),
+            "add 2D": SubTest(func=add, args=[(1, 2), (3, 4), (5, 6)]),
+            "scale 3D": SubTest(func=scale, args=[2, (1, 2, 3)]),
+            "subtract 3D": SubTest(func=subtract, args=[(1, 2, 3), (4, 5, 6)]),
+            "cross 3D": SubTest(func=cross, args=[(3, -2, 2), (2, 4, 3)]),
+            "linear_combination 2D": SubTest(
+                func=linear_combination, args=[[1, 2], (1, 1), (2, 2)]
+            ),
+            "Vec3": SubTest(func=Vec3, args=[1, 2, 3]),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            got = subtest_data.func(*subtest_data.args)
+            self.assertTrue(
+                all(type(coord) is float for coord in got),
+                f"Subtest '{subtest_name}' failed: got {got}",
+            )
+        self.assertIs(type(dot((1, 2, 3), (4, 5, 6))), float)
+
 
 if __name__ == "__main__":
     unittest.main()
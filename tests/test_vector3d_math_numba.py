@@ -0,0 +1,122 @@
+"""Testing vector3d_math_numba functions"""
+import unittest
+from collections import namedtuple
+from math import pi
+
+import numpy as np
+
+try:
+    from vec3d.math.vector3d_math_numba import (
+        angle_between_nb,
+        cross_nb,
+        dot_nb,
+        length_nb,
+        unit_nb,
+    )
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+class TestVector3DMathNumba(unittest.TestCase):
+    """Tests the vector3d_math_numba package functions"""
+
+    def test_happy_path(self):
+        SubTest = namedtuple("Subtest", ["func", "args", "expected"])
+
+        subtests = {
+            "dot of 3D vectors": SubTest(
+                func=dot_nb, args=[(1, 2, 3), (4, 5, 6)], expected=32
+            ),
+            "dot of 10D vectors": SubTest(
+                func=dot_nb,
+                args=[
+                    (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+                    (11, 12, 13, 14, 15, 16, 17, 18, 19, 20),
+                ],
+                expected=935,
+            ),
+            "cross of 3D vectors": SubTest(
+                func=cross_nb,
+                args=[(3, -2, 2), (2, 4, 3)],
+                expected=(-14, -5, 16),
+            ),
+            "length of 3D vector": SubTest(
+                func=length_nb, args=[(2, 3, 6)], expected=7
+            ),
+            "unit of 3D vector": SubTest(
+                func=unit_nb, args=[(2, 3, 6)], expected=(2 / 7, 3 / 7, 6 / 7)
+            ),
+            "angle between 3D vectors": SubTest(
+                func=angle_between_nb,
+                args=[(1, 0, 0), (0, 1, 0)],
+                expected=pi / 2,
+            ),
+            "angle between parallel vectors with rounding errors": SubTest(
+                func=angle_between_nb,
+                args=[
+                    (
+                        0.8444218515250481,
+                        0.7579544029403025,
+                        0.420571580830845,
+                    ),
+                    (
+                        2.5891675029296337 * 0.8444218515250481,
+                        2.5891675029296337 * 0.7579544029403025,
+                        2.5891675029296337 * 0.420571580830845,
+                    ),
+                ],
+                expected=0,
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            args = [np.asarray(a, dtype=np.float64) for a in subtest_data.args]
+            got = subtest_data.func(*args)
+            np.testing.assert_allclose(
+                got,
+                subtest_data.expected,
+                err_msg=(
+                    f"{subtest_name}: "
+                    f"expected {subtest_data.expected} but got {got}"
+                ),
+            )
+
+    def test_unhappy_path(self):
+        SubTest = namedtuple("Subtest", ["func", "args", "expected_ex"])
+
+        subtests = {
+            "dot of vectors of different sizes": SubTest(
+                func=dot_nb, args=[(1, 1, 1), (1, 1)], expected_ex=TypeError
+            ),
+            "cross of 2D vectors": SubTest(
+                func=cross_nb, args=[(1, 2), (3, 4)], expected_ex=TypeError
+            ),
+            "cross of 4D vectors": SubTest(
+                func=cross_nb,
+                args=[(1, 2, 3, 4), (1, 2, 3, 4)],
+                expected_ex=TypeError,
+            ),
+        }
+
+        for subtest_name, subtest_data in subtests.items():
+            args = [np.asarray(a, dtype=np.float64) for a in subtest_data.args]
+            with self.assertRaises(
+                subtest_data.expected_ex, msg=f"Subtest '{subtest_name}' failed"
+            ):
+                subtest_data.func(*args)
+
+    def test_nan(self):
+        u = np.asarray((np.nan, 0, 0), dtype=np.float64)
+        v = np.asarray((1, 0, 0), dtype=np.float64)
+
+        self.assertTrue(np.isnan(dot_nb(u, v)))
+        self.assertTrue(np.isnan(length_nb(u)))
+        self.assertTrue(np.isnan(angle_between_nb(u, v)))
+        self.assertTrue(np.isnan(unit_nb(u)).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
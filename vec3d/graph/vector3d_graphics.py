@@ -6,6 +6,7 @@ colors and line styles, and a function draw3d() to render the figures.
 """
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from enum import Enum
 from typing import Sequence
 
@@ -13,6 +14,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import FancyArrowPatch
 from mpl_toolkits.mplot3d import proj3d
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 logging.basicConfig(
     format="%(asctime)s [%(levelname)8s] (%(name)s) | %(message)s"
@@ -62,7 +64,7 @@ class FancyArrow3D(FancyArrowPatch):
 
     def __init__(self, xs, ys, zs, *args, **kwargs):
         super().__init__((0, 0), (0, 0), *args, **kwargs)
-        self._verts3d = xs, ys, zs
+        self._verts3d = tuple(xs), tuple(ys), tuple(zs)
 
     def do_3d_projection(
         self, renderer=None  # pylint: disable=unused-argument
@@ -71,9 +73,22 @@ class FancyArrow3D(FancyArrowPatch):
 
         # self.axes.M is used to convert 3D data into something that can be
         # plotted using Matplotlib's 2D plotting functions.
-        xs, ys, zs = proj3d.proj_transform(xs3d, ys3d, zs3d, self.axes.M)
+        xs, ys, zs = _proj_transform_cached(
+            xs3d, ys3d, zs3d, self.axes.M.tobytes()
+        )
         self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
-        return np.min(zs)
+        return min(zs)
+
+
+@lru_cache(maxsize=2048)
+def _proj_transform_cached(xs, ys, zs, m_bytes):
+    """Memoized version of proj3d.proj_transform, so that redraws that don't
+    change the points nor the camera (given by the bytes of the 4x4 projection
+    matrix) skip the transformation.
+    """
+    m = np.frombuffer(m_bytes, dtype=np.float64).reshape(4, 4)
+    txs, tys, tzs = proj3d.proj_transform(xs, ys, zs, m)
+    return tuple(txs.tolist()), tuple(tys.tolist()), tuple(tzs.tolist())
 
 
 IntOrFloat = int | float
@@ -112,14 +127,48 @@ class Figure3D(ABC):
         xs, ys, zs = [[start_point[i], end_point[i]] for i in range(0, 3)]
         axes.plot(xs, ys, zs, color=color.value, linestyle=linestyle.value)
 
+    @staticmethod
+    def draw_segments(
+        *,
+        axes,
+        segments,
+        color=Colors3D.BLACK,
+        linestyle=LineStyles3D.SOLID,
+    ) -> None:
+        """Static utility method used to draw several segments with the same
+        color and linestyle using a single Matplotlib artist. This function is
+        called by its side-effect.
+
+        Args:
+            axes: Matplotlib axes
+            segments (ArrayLike): the segments to draw, as an array of shape
+                (n, 2, 3) holding the starting and ending point of each segment
+            color (Colors3D): the color of the segments
+            linestyle (Linestyle3D): the linestyle of the segments
+
+        Returns:
+            None
+        """
+        segments = np.asarray(segments, dtype=np.float64)
+        if not len(segments):
+            return
+        had_data = axes.has_data()
+        axes.add_collection3d(
+            Line3DCollection(
+                segments, colors=color.value, linestyles=linestyle.value
+            )
+        )
+        axes.auto_scale_xyz(
+            segments[..., 0], segments[..., 1], segments[..., 2], had_data
+        )
+
     @abstractmethod
-    def extract_vectors(self) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
-        """Generator function that returns the vectors (points) that define the
-        figure.
+    def extract_vectors(self) -> np.ndarray:
+        """Returns the vectors (points) that define the figure.
 
         Returns:
-            tuple[IntOrFloat, IntOrFloat, IntOrFloat]: a tuple with the
-                corresponding Cartesian coordinates of the vector (point) in the
+            np.ndarray: an array of shape (n, 3) with the corresponding
+                Cartesian coordinates of each of the n vectors (points) in the
                 3D space.
         """
 
@@ -151,9 +200,8 @@ class Arrow3D(Figure3D):
         self.color = color
         self.linestyle = linestyle
 
-    def extract_vectors(self) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
-        yield self.tip
-        yield self.tail
+    def extract_vectors(self) -> np.ndarray:
+        return np.asarray([self.tip, self.tail], dtype=np.float64)
 
     def render(self, *, axes, **kwargs) -> None:
         xs, ys, zs = zip(self.tail, self.tip)
@@ -180,14 +228,18 @@ class Points3D(Figure3D):
     def __init__(self, *vectors, color=Colors3D.BLACK) -> None:
         self.vectors = list(vectors)
         self.color = color
+        # The points are converted to an (n, 3) array once, and rendering uses
+        # per-axis views of it instead of unpacking the list of points.
+        self._points = np.asarray(vectors, dtype=np.float64).reshape(-1, 3)
+        self._xs, self._ys, self._zs = self._points.T
 
-    def extract_vectors(self) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
-        for v in self.vectors:
-            yield v
+    def extract_vectors(self) -> np.ndarray:
+        return self._points
 
     def render(self, *, axes, **kwargs) -> None:
-        xs, ys, zs = zip(*self.vectors)
-        axes.scatter(xs, ys, zs, color=self.color.value, **kwargs)
+        axes.scatter(
+            self._xs, self._ys, self._zs, color=self.color.value, **kwargs
+        )
 
 
 class Segment3D(Figure3D):
@@ -209,9 +261,10 @@ class Segment3D(Figure3D):
         self.color = color
         self.linestyle = linestyle
 
-    def extract_vectors(self) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
-        yield self.start_point
-        yield self.end_point
+    def extract_vectors(self) -> np.ndarray:
+        return np.asarray(
+            [self.start_point, self.end_point], dtype=np.float64
+        )
 
     def render(self, *, axes, **kwargs) -> None:
         Figure3D.draw_segment(
@@ -228,41 +281,35 @@ class Box3D(Figure3D):
     its Cartesian coordinates, and its projection into the x-, y-, and z-axes.
     """
 
+    # Edges of the unit box, scaled by the box corner when rendering. The three
+    # edges that lie on the coordinate axes are not drawn.
+    _EDGES = np.array(
+        [
+            [[0, 1, 0], [1, 1, 0]],
+            [[0, 0, 1], [0, 1, 1]],
+            [[0, 0, 1], [1, 0, 1]],
+            [[0, 1, 0], [0, 1, 1]],
+            [[1, 0, 0], [1, 1, 0]],
+            [[1, 0, 0], [1, 0, 1]],
+            [[0, 1, 1], [1, 1, 1]],
+            [[1, 0, 1], [1, 1, 1]],
+            [[1, 1, 0], [1, 1, 1]],
+        ],
+        dtype=np.int8,
+    )
+
     def __init__(self, x: IntOrFloat, y: IntOrFloat, z: IntOrFloat) -> None:
         self.vector = (x, y, z)
 
-    def extract_vectors(self) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
-        yield self.vector
+    def extract_vectors(self) -> np.ndarray:
+        return np.asarray([self.vector], dtype=np.float64)
 
     def render(self, *, axes, **kwargs) -> None:
-        x, y, z = self.vector
-        kwargs = {"linestyle": LineStyles3D.DASHED, "color": Colors3D.GRAY}
-        Figure3D.draw_segment(
-            axes=axes, start_point=(0, y, 0), end_point=(x, y, 0), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(0, 0, z), end_point=(0, y, z), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(0, 0, z), end_point=(x, 0, z), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(0, y, 0), end_point=(0, y, z), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(x, 0, 0), end_point=(x, y, 0), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(x, 0, 0), end_point=(x, 0, z), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(0, y, z), end_point=(x, y, z), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(x, 0, z), end_point=(x, y, z), **kwargs
-        )
-        Figure3D.draw_segment(
-            axes=axes, start_point=(x, y, 0), end_point=(x, y, z), **kwargs
+        Figure3D.draw_segments(
+            axes=axes,
+            segments=Box3D._EDGES * np.array(self.vector, dtype=np.float64),
+            color=Colors3D.GRAY,
+            linestyle=LineStyles3D.DASHED,
         )
 
 
@@ -278,20 +325,20 @@ class Polygon3D(Figure3D):
         self.vertices = vertices
         self.color = color
         self.linestyle = linestyle
+        self._vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
 
-    def extract_vectors(self) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
-        for v in self.vertices:
-            yield v
+    def extract_vectors(self) -> np.ndarray:
+        return self._vertices
 
     def render(self, *, axes, **kwargs) -> None:
-        for i in range(0, len(self.vertices)):
-            Figure3D.draw_segment(
-                axes=axes,
-                start_point=self.vertices[i],
-                end_point=self.vertices[(i + 1) % len(self.vertices)],
-                color=self.color,
-                linestyle=self.linestyle,
-            )
+        Figure3D.draw_segments(
+            axes=axes,
+            segments=np.stack(
+                [self._vertices, np.roll(self._vertices, -1, axis=0)], axis=1
+            ),
+            color=self.color,
+            linestyle=self.linestyle,
+        )
 
 
 def draw3d(
@@ -365,14 +412,13 @@ def draw3d(
     ax = fig.add_subplot(111, projection="3d")
     ax.view_init(elev=elev, azim=azim)
 
-    all_vectors = [v for obj in objects for v in obj.extract_vectors()]
+    all_vectors = [obj.extract_vectors() for obj in objects]
     if origin:
-        all_vectors.append((0, 0, 0))
-    xs, ys, zs = zip(*all_vectors)
+        all_vectors.append(np.zeros((1, 3)))
+    arr = np.concatenate(all_vectors) if all_vectors else np.empty((0, 3))
 
-    max_x, min_x = max(0, *xs), min(0, *xs)
-    max_y, min_y = max(0, *ys), min(0, *ys)
-    max_z, min_z = max(0, *zs), min(0, *zs)
+    max_x, max_y, max_z = arr.max(axis=0, initial=0).tolist()
+    min_x, min_y, min_z = arr.min(axis=0, initial=0).tolist()
 
     x_size = max_x - min_x
     y_size = max_y - min_y
@@ -394,20 +440,13 @@ def draw3d(
         fig.set_size_inches(width, width * x_size / y_size)
 
     if axes:
-        Figure3D.draw_segment(
-            axes=ax,
-            start_point=(plot_x_range[0], 0, 0),
-            end_point=(plot_x_range[1], 0, 0),
-        )
-        Figure3D.draw_segment(
-            axes=ax,
-            start_point=(0, plot_y_range[0], 0),
-            end_point=(0, plot_y_range[1], 0),
-        )
-        Figure3D.draw_segment(
+        Figure3D.draw_segments(
             axes=ax,
-            start_point=(0, 0, plot_z_range[0]),
-            end_point=(0, 0, plot_z_range[1]),
+            segments=[
+                [(plot_x_range[0], 0, 0), (plot_x_range[1], 0, 0)],
+                [(0, plot_y_range[0], 0), (0, plot_y_range[1], 0)],
+                [(0, 0, plot_z_range[0]), (0, 0, plot_z_range[1])],
+            ],
         )
 
     if origin:
@@ -2,29 +2,47 @@
 __init__.py for the vector3d.math module which provides the math utilities.
 """
 from vec3d.math.vector3d_math import (
+    Vec3,
     add,
+    add_batched,
     angle_between,
+    cos_angle_between,
     cross,
+    cross_batched,
     dot,
+    dot_batched,
     length,
+    length_batched,
     linear_combination,
     scale,
     subtract,
     to_degrees,
+    to_degrees_batched,
     to_radians,
+    to_radians_batched,
     unit,
+    unit_batched,
 )
 
 __all__ = [
+    "Vec3",
     "add",
+    "add_batched",
     "angle_between",
+    "cos_angle_between",
     "cross",
+    "cross_batched",
     "dot",
+    "dot_batched",
     "length",
+    "length_batched",
     "linear_combination",
     "scale",
     "subtract",
     "to_degrees",
+    "to_degrees_batched",
     "to_radians",
+    "to_radians_batched",
     "unit",
+    "unit_batched",
 ]
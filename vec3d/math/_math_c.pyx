@@ -0,0 +1,94 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional compiled kernels for the vector operations of vec3d.math.
+
+The kernels take the vectors as sequences of Cartesian coordinates, unpack them
+into C doubles (which also converts ints), and do the computation on them.
+"""
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from libc.math cimport hypot as c_hypot
+
+
+cdef extern from "_math_simd.h":
+    double vec3d_dot3(
+        double ux, double uy, double uz, double vx, double vy, double vz
+    ) noexcept nogil
+    double vec3d_dot4(
+        double u0, double u1, double u2, double u3,
+        double v0, double v1, double v2, double v3
+    ) noexcept nogil
+    double vec3d_dot_nd(
+        const double *u, const double *v, Py_ssize_t n
+    ) noexcept nogil
+
+
+cpdef double dot3(u, v):
+    """Returns the dot product of the 3D vectors u and v."""
+    cdef double ux, uy, uz, vx, vy, vz
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return vec3d_dot3(ux, uy, uz, vx, vy, vz)
+
+
+cpdef double dot4(u, v):
+    """Returns the dot product of the 4D vectors u and v."""
+    cdef double u0, u1, u2, u3, v0, v1, v2, v3
+    u0, u1, u2, u3 = u
+    v0, v1, v2, v3 = v
+    return vec3d_dot4(u0, u1, u2, u3, v0, v1, v2, v3)
+
+
+cpdef double dotn(u, v):
+    """Returns the dot product of the n-dimensional vectors u and v, which
+    must be of the same size."""
+    cdef Py_ssize_t i, n = len(u)
+    cdef double *buf
+    cdef double result
+
+    buf = <double *>PyMem_Malloc(2 * n * sizeof(double))
+    if buf == NULL:
+        raise MemoryError()
+    try:
+        for i in range(n):
+            buf[i] = u[i]
+            buf[n + i] = v[i]
+        result = vec3d_dot_nd(buf, buf + n, n)
+    finally:
+        PyMem_Free(buf)
+    return result
+
+
+cpdef tuple add3(u, v):
+    """Returns the sum of the 3D vectors u and v."""
+    cdef double ux, uy, uz, vx, vy, vz
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (ux + vx, uy + vy, uz + vz)
+
+
+cpdef tuple sub3(u, v):
+    """Returns the result of subtracting the 3D vector v from u."""
+    cdef double ux, uy, uz, vx, vy, vz
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (ux - vx, uy - vy, uz - vz)
+
+
+cpdef tuple cross3(u, v):
+    """Returns the cross product of the 3D vectors u and v."""
+    cdef double ux, uy, uz, vx, vy, vz
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
+
+
+cpdef tuple unit3(v):
+    """Returns the vector of length one oriented in the same direction as the
+    3D vector v."""
+    cdef double x, y, z, length, inv
+    x, y, z = v
+    length = c_hypot(c_hypot(x, y), z)
+    if length == 0:
+        raise ZeroDivisionError("float division by zero")
+    inv = 1.0 / length
+    return (inv * x, inv * y, inv * z)
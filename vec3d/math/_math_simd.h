@@ -0,0 +1,67 @@
+/*
+ * SIMD helpers for the optional compiled kernels of vec3d.math.
+ *
+ * The dot products use the SSE4.1 DPPD instruction (_mm_dp_pd) when available,
+ * which multiplies and adds a pair of doubles in a single instruction. dot3
+ * adds the terms in the same order as the scalar version, while dot4 adds the
+ * partial sums of the two pairs (pairwise summation).
+ */
+#ifndef VEC3D_MATH_SIMD_H
+#define VEC3D_MATH_SIMD_H
+
+#if defined(__SSE2__)
+#include <immintrin.h>
+#endif
+
+static inline double vec3d_dot3(double ux, double uy, double uz,
+                                double vx, double vy, double vz)
+{
+#if defined(__SSE4_1__)
+    /* mask 0x31: multiply both lanes, store the sum in the low lane */
+    __m128d a = _mm_set_pd(uy, ux);
+    __m128d b = _mm_set_pd(vy, vx);
+    return _mm_cvtsd_f64(_mm_dp_pd(a, b, 0x31)) + uz * vz;
+#else
+    return ux * vx + uy * vy + uz * vz;
+#endif
+}
+
+static inline double vec3d_dot4(double u0, double u1, double u2, double u3,
+                                double v0, double v1, double v2, double v3)
+{
+#if defined(__SSE4_1__)
+    __m128d lo = _mm_dp_pd(_mm_set_pd(u1, u0), _mm_set_pd(v1, v0), 0x31);
+    __m128d hi = _mm_dp_pd(_mm_set_pd(u3, u2), _mm_set_pd(v3, v2), 0x31);
+    return _mm_cvtsd_f64(lo) + _mm_cvtsd_f64(hi);
+#else
+    return u0 * v0 + u1 * v1 + u2 * v2 + u3 * v3;
+#endif
+}
+
+/*
+ * Dot product of two n-dimensional vectors. With AVX2 and FMA it accumulates
+ * four lanes at a time and then reduces the accumulator with a shuffle tree,
+ * handling the remaining n % 4 coordinates with a scalar loop.
+ */
+static inline double vec3d_dot_nd(const double *u, const double *v,
+                                  Py_ssize_t n)
+{
+    Py_ssize_t i = 0;
+    double result = 0.0;
+#if defined(__AVX2__) && defined(__FMA__)
+    __m256d acc = _mm256_setzero_pd();
+    for (; i + 4 <= n; i += 4) {
+        acc = _mm256_fmadd_pd(_mm256_loadu_pd(u + i), _mm256_loadu_pd(v + i),
+                              acc);
+    }
+    __m128d pair = _mm_add_pd(_mm256_castpd256_pd128(acc),
+                              _mm256_extractf128_pd(acc, 1));
+    result = _mm_cvtsd_f64(_mm_add_sd(pair, _mm_unpackhi_pd(pair, pair)));
+#endif
+    for (; i < n; i++) {
+        result += u[i] * v[i];
+    }
+    return result;
+}
+
+#endif /* VEC3D_MATH_SIMD_H */
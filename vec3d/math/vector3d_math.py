@@ -1,130 +1,367 @@
 """
 A library providing a few Math related utility functions for the 3D space.
 """
-from math import acos, pi, sqrt
+from functools import lru_cache
+from math import acos, hypot, pi, sqrt
 from typing import Sequence
 
-# Type alias
-IntOrFloat = int | float
+import numpy as np
+
+
+# Conversion factors between degrees and radians
+_DEG2RAD = pi / 180.0
+_RAD2DEG = 180.0 / pi
+
+# Smallest positive normal float64, below which squared lengths lose precision
+_FLOAT64_TINY = np.finfo(np.float64).tiny
+
+# Smallest number of vectors for which add uses a NumPy reduction. Converting
+# the vectors to an array dominates the cost of NumPy, so the generated
+# straight-line code is faster below this, whatever the size of the vectors.
+_NUMPY_MIN_VECTORS = 32
+
+# Largest number of vectors, and smallest size of the vectors, for which
+# linear_combination uses generated straight-line code instead of NumPy.
+_UNROLL_MAX_VECTORS = 8
+_NUMPY_MIN_DIM = 8
+
+
+class Vec3:
+    """An immutable 3D vector designated by its Cartesian coordinates.
+
+    Its coordinates are stored in slots and accessed as attributes, which is
+    cheaper than indexing a tuple in hot loops. A Vec3 also behaves as a
+    sequence of three coordinates, so it can be passed to any of the functions
+    of this module in place of a tuple. Its coordinates are always floats.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float, y: float, z: float) -> None:
+        _set_x(self, float(x))
+        _set_y(self, float(y))
+        _set_z(self, float(z))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def __repr__(self) -> str:
+        return f"Vec3(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z))
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, i):
+        if i == 0 or i == -3:
+            return self.x
+        if i == 1 or i == -2:
+            return self.y
+        if i == 2 or i == -1:
+            return self.z
+        if isinstance(i, slice):
+            return (self.x, self.y, self.z)[i]
+        raise IndexError("Vec3 index out of range")
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __add__(self, other: "Vec3") -> "Vec3":
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: "Vec3") -> "Vec3":
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, s: float) -> "Vec3":
+        if not isinstance(s, (int, float)):
+            return NotImplemented
+        return Vec3(s * self.x, s * self.y, s * self.z)
+
+    __rmul__ = __mul__
+
+    def dot(self, other: "Vec3") -> float:
+        """Returns the dot product of this vector and the given one."""
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: "Vec3") -> "Vec3":
+        """Returns the cross product of this vector and the given one."""
+        return Vec3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def length(self) -> float:
+        """Returns the length of this vector."""
+        return hypot(self.x, self.y, self.z)
+
+
+# Setters of the Vec3 slots, which bypass the __setattr__ that makes Vec3
+# immutable and are cheaper than calling object.__setattr__.
+_set_x, _set_y, _set_z = Vec3.x.__set__, Vec3.y.__set__, Vec3.z.__set__
 
 
 def add(
-    *vectors: tuple[IntOrFloat, IntOrFloat, IntOrFloat]
-) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
+    *vectors: tuple[float, float, float]
+) -> tuple[float, float, float]:
     """Performs the addition of any given number of 3D vectors
 
     Args:
-        *vectors ([tuple[IntOrFloat, IntOrFloat, IntOrFloat]]): variable number
+        *vectors ([tuple[float, float, float]]): variable number
             of 3D vectors designated by their Cartesian coordinates
 
     Raises:
         ValueError: If fewer than two vectors are provided.
+        TypeError: If the vectors are not of the same size.
 
     Returns:
-        tuple[IntOrFloat, IntOrFloat, IntOrFloat]: the vector sum
+        tuple[float, float, float]: the vector sum
     """
-    if len(vectors) < 2:
+    n = len(vectors)
+    if n < 2:
         raise ValueError("At least two 3D vectors were expected")
 
-    if not _same_size(*vectors):
-        raise TypeError("Size of the vectors must be same")
+    _validate_equal_lengths(vectors)
+
+    d = len(vectors[0])
+    if d == 3:
+        if n == 2:
+            return _add3(vectors[0], vectors[1])
+        if n == 3:
+            return _add_triple(*vectors)
+
+    if n >= _NUMPY_MIN_VECTORS:
+        stacked = np.asarray(vectors, dtype=np.float64)
+        return tuple(stacked.sum(axis=0).tolist())
+
+    return _make_add(d, n)(*vectors)
+
+
+def add_batched(x: np.ndarray) -> np.ndarray:
+    """Performs the addition of many vectors in a single vectorized
+    operation.
+
+    Args:
+        x (np.ndarray): array of shape (n, d) holding one vector per row,
+            designated by its Cartesian coordinates.
 
-    zipped_by_coords = zip(*vectors)
-    sum_by_coords = [sum(coords) for coords in zipped_by_coords]
-    return tuple(sum_by_coords)
+    Returns:
+        np.ndarray: array of shape (d,) with the vector sum.
+    """
+    return np.add.reduce(np.asarray(x), axis=0, dtype=np.float64)
 
 
 def scale(
-    s: IntOrFloat, v: tuple[IntOrFloat, IntOrFloat, IntOrFloat]
-) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
+    s: float, v: tuple[float, float, float]
+) -> tuple[float, float, float]:
     """Performs the scalar product
 
     Args:
-        s (IntOrFloat): the scalar
-        v (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the vector given its
+        s (float): the scalar
+        v (tuple[float, float, float]): the vector given its
             Cartesian coordinates
 
     Returns:
-        tuple[IntOrFloat, IntOrFloat, IntOrFloat]: the vector that result from
+        tuple[float, float, float]: the vector that result from
             multiplying the vector by the scalar.
     """
+    # Multiplying by a float scalar already gives float coordinates
+    s = float(s)
+    if len(v) == 3:
+        vx, vy, vz = v
+        return (s * vx, s * vy, s * vz)
+
     return tuple(s * coord_component for coord_component in v)
 
 
 def subtract(
-    v, w: tuple[IntOrFloat, IntOrFloat, IntOrFloat]
-) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
+    v, w: tuple[float, float, float]
+) -> tuple[float, float, float]:
     """Calculates the result of subtracting the 3D vector w from the vector v.
     In other words, it returns the displacement vector from w to v.
 
     Args:
-        v (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the vector to subtract
+        v (tuple[float, float, float]): the vector to subtract
             from, designated by its Cartesian coordinates.
-        w (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the vector to be
+        w (tuple[float, float, float]): the vector to be
             subtracted, designated by its Cartesian coordinates.)
 
     Returns:
-        tuple[IntOrFloat, IntOrFloat, IntOrFloat]: the displacement vector.
+        tuple[float, float, float]: the displacement vector.
         That is the vector that result from subtracting w from v.
     """
-    if not _same_size(v, w):
+    if len(v) != len(w):
         raise TypeError("Size of the vectors must be same")
 
-    return tuple([v_c - w_c for v_c, w_c in zip(v, w)])
+    if len(v) == 3:
+        return _sub3(v, w)
 
+    return tuple(float(v_c - w_c) for v_c, w_c in zip(v, w))
 
-def length(v: tuple[IntOrFloat, IntOrFloat, IntOrFloat]) -> float:
+
+def length(v: tuple[float, float, float]) -> float:
     """Calculates the length of a 3D vector designated by its Cartesian
     coordinates.
 
     Args:
-        v (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the vector whose length
+        v (tuple[float, float, float]): the vector whose length
             is to be calculated, designated by its Cartesian coordinates.
 
     Returns:
-        tuple[IntOrFloat, IntOrFloat, IntOrFloat]: the length of the vector.
+        tuple[float, float, float]: the length of the vector.
     """
-    return sqrt(sum([coord**2 for coord in v]))
+    # hypot is a single C call, and avoids the overflow and loss of precision
+    # of squaring the coordinates
+    return hypot(*v)
+
+
+def length_batched(x: np.ndarray) -> np.ndarray:
+    """Calculates the lengths of many vectors in a single vectorized operation.
+    The squares and their sum are fused in a single pass over the data, so for
+    best performance x should be a C-contiguous float64 array: a transposed
+    (d, n) array or a strided view forces strided loads.
+
+    Args:
+        x (np.ndarray): array of shape (n, d) holding one vector per row,
+            designated by its Cartesian coordinates.
+
+    Returns:
+        np.ndarray: array of shape (n,) with the length of each vector.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    squared = np.einsum("...i,...i->...", x, x)
+    lengths = np.asarray(np.sqrt(squared))
+
+    # Squaring overflows for very large coordinates and underflows for very
+    # small ones, so those lengths are recomputed with hypot, as in length.
+    wrong = ~((squared >= _FLOAT64_TINY) & (squared < np.inf))
+    if wrong.any():
+        lengths[wrong] = np.hypot.reduce(x[wrong], axis=-1)
+    # [()] returns a NumPy scalar rather than a 0-d array for a single vector
+    return lengths[()]
 
 
 def dot(
-    u: tuple[IntOrFloat, IntOrFloat, IntOrFloat],
-    v: tuple[IntOrFloat, IntOrFloat, IntOrFloat],
+    u: tuple[float, float, float],
+    v: tuple[float, float, float],
 ) -> float:
     """Calculates the dot product of the given 3D vectors, given their Cartesian
     coordinates.
 
     Args:
-        u (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the first vector
+        u (tuple[float, float, float]): the first vector
             designated byt its Cartesian coordinates.
-        v (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the second vector
+        v (tuple[float, float, float]): the second vector
             designated byt its Cartesian coordinates.
 
     Returns:
         float: the result of the dot product of u and v.
     """
-    if not _same_size(u, v):
+    if len(u) != len(v):
         raise TypeError("Size of the vectors must be same")
 
-    return sum((coord_u * coord_v) for coord_u, coord_v in zip(u, v))
+    # Small dimensions are unrolled to avoid the zip and generator overhead
+    n = len(u)
+    if n == 3:
+        return _dot3(u, v)
+    if n == 2:
+        return float(u[0] * v[0] + u[1] * v[1])
+    if n == 4:
+        return _dot4(u, v)
+
+    return _dotn(u, v)
+
+
+def dot_batched(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Calculates the dot products of the corresponding pairs of vectors in u
+    and v in a single vectorized operation. As with length_batched, u and v
+    should preferably be C-contiguous float64 arrays. u and v are broadcast
+    against each other, so for example a single vector of shape (d,) can be
+    dotted with every vector of an (n, d) array.
+
+    Args:
+        u (np.ndarray): array of shape (n, d) holding the first vector of each
+            pair, designated by its Cartesian coordinates.
+        v (np.ndarray): array of shape (n, d) holding the second vector of each
+            pair, designated by its Cartesian coordinates.
+
+    Raises:
+        TypeError: If the vectors of u and v are not of the same size.
+
+    Returns:
+        np.ndarray: array of shape (n,) with the dot product of each pair.
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    if u.shape[-1] != v.shape[-1]:
+        raise TypeError("Size of the vectors must be same")
+
+    # einsum fuses the products and the sum, with no temporary product array
+    return np.einsum("...i,...i->...", u, v)
 
 
 def angle_between(
-    u: tuple[IntOrFloat, IntOrFloat, IntOrFloat],
-    v: tuple[IntOrFloat, IntOrFloat, IntOrFloat],
+    u: tuple[float, float, float],
+    v: tuple[float, float, float],
 ) -> float:
     """Calculates the angle between the given vectors
 
     Args:
-        u (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the first vector
+        u (tuple[float, float, float]): the first vector
             designated by its Cartesian coordinates.
-        v (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the second vector
+        v (tuple[float, float, float]): the second vector
             designated by its Cartesian coordinates.
 
     Returns:
         float: the angle between u and v expressed in radians.
     """
-    return acos(dot(u, v) / (length(u) * length(v)))
+    # The cosine is clamped to [-1, 1] as rounding errors can take it slightly
+    # out of acos domain for (anti)parallel vectors. Explicit comparisons are
+    # used instead of min/max so that nan is not clamped.
+    cos_angle = cos_angle_between(u, v)
+    if cos_angle > 1.0:
+        cos_angle = 1.0
+    elif cos_angle < -1.0:
+        cos_angle = -1.0
+    return acos(cos_angle)
+
+
+def cos_angle_between(
+    u: tuple[float, float, float],
+    v: tuple[float, float, float],
+) -> float:
+    """Calculates the cosine of the angle between the given vectors, which is
+    cheaper than calculating the angle itself as it doesn't require acos.
+    As the cosine is monotonically decreasing in [0, pi], it can be used to
+    compare angles: for example, to check whether the angle between u and v is
+    smaller than x, use cos_angle_between(u, v) > cos(x).
+
+    Args:
+        u (tuple[float, float, float]): the first vector
+            designated by its Cartesian coordinates.
+        v (tuple[float, float, float]): the second vector
+            designated by its Cartesian coordinates.
+
+    Returns:
+        float: the cosine of the angle between u and v.
+    """
+    # A single sqrt of the product of the squared lengths instead of computing
+    # both lengths.
+    return dot(u, v) / sqrt(dot(u, u) * dot(v, v))
 
 
 def to_radians(angle_deg: float) -> float:
@@ -136,7 +373,19 @@ def to_radians(angle_deg: float) -> float:
     Returns:
         float: the equivalent angle expressed in radians.
     """
-    return angle_deg * pi / 180
+    return angle_deg * _DEG2RAD
+
+
+def to_radians_batched(angles_deg: np.ndarray) -> np.ndarray:
+    """Returns the radians values for an array of angles expressed in degrees.
+
+    Args:
+        angles_deg (np.ndarray): the values of the angles expressed in degrees.
+
+    Returns:
+        np.ndarray: the equivalent angles expressed in radians.
+    """
+    return np.asarray(angles_deg) * _DEG2RAD
 
 
 def to_degrees(angle_rad: float) -> float:
@@ -148,65 +397,253 @@ def to_degrees(angle_rad: float) -> float:
     Returns:
         float: the equivalent angle expressed in degrees.
     """
-    return angle_rad * 180 / pi
+    return angle_rad * _RAD2DEG
+
+
+def to_degrees_batched(angles_rad: np.ndarray) -> np.ndarray:
+    """Returns the degrees values for an array of angles expressed in radians.
+
+    Args:
+        angles_rad (np.ndarray): the values of the angles expressed in radians.
+
+    Returns:
+        np.ndarray: the equivalent angles expressed in degrees.
+    """
+    return np.asarray(angles_rad) * _RAD2DEG
 
 
 def cross(
-    u: tuple[IntOrFloat, IntOrFloat, IntOrFloat],
-    v: tuple[IntOrFloat, IntOrFloat, IntOrFloat],
-) -> tuple[IntOrFloat, IntOrFloat, IntOrFloat]:
+    u: tuple[float, float, float],
+    v: tuple[float, float, float],
+) -> tuple[float, float, float]:
     """Calculates the cross product of the given 3D vectors, given their
     Cartesian coordinates.
 
     Args:
-        u (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the first vector
+        u (tuple[float, float, float]): the first vector
             designated byt its Cartesian coordinates.
-        v (tuple[IntOrFloat, IntOrFloat, IntOrFloat]): the second vector
+        v (tuple[float, float, float]): the second vector
             designated byt its Cartesian coordinates.
 
+    Raises:
+        TypeError: If any of the vectors is not a 3D vector.
+
     Returns:
-        tuple[IntOrFloat, IntOrFloat, IntOrFloat]: the result of the cross
+        tuple[float, float, float]: the result of the cross
         product of u and v.
     """
-    ux, uy, uz = u
-    vx, vy, vz = v
-    return (uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
+    if len(u) != 3 or len(v) != 3:
+        raise TypeError("Cross product is only defined for 3D vectors")
+
+    return _cross3(u, v)
+
+
+def cross_batched(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Calculates the cross products of the corresponding pairs of 3D vectors
+    in the arrays a and b in a single vectorized operation. Prefer batching the
+    vectors and calling this function once over calling cross in a Python loop.
+
+    Args:
+        a (np.ndarray): array of shape (n, 3) holding the first vector of each
+            pair, designated by its Cartesian coordinates.
+        b (np.ndarray): array of shape (n, 3) holding the second vector of each
+            pair, designated by its Cartesian coordinates.
+
+    Returns:
+        np.ndarray: array of shape (n, 3) with the cross product of each pair.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    ax, ay, az = a[..., 0], a[..., 1], a[..., 2]
+    bx, by, bz = b[..., 0], b[..., 1], b[..., 2]
+    return np.stack(
+        [ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx], axis=-1
+    )
 
 
 def linear_combination(
     scalars: Sequence[float],
-    *vectors: tuple[IntOrFloat, IntOrFloat, IntOrFloat]
+    *vectors: tuple[float, float, float]
 ):
     """Returns the linear combination of applying each of the scalars to the
     corresponding vectors in sequence. For example
     linear_combination([1, 2, 3], (1, 1, 1), (2, 2, 2), (3, 3, 3)) will return
-    the vector (14, 14, 14).
+    the vector (14.0, 14.0, 14.0).
     """
     if scalars is None or vectors is None:
         raise TypeError("Arguments are required")
 
-    if len(scalars) != len(vectors):
+    n = len(vectors)
+    if len(scalars) != n:
         raise ValueError("The same number of scalars and vectors are required")
 
-    if len(scalars) < 2:
+    if n < 2:
         raise ValueError("At least two scalars and two vectors are required")
 
-    return add(*[scale(s, v) for s, v in zip(scalars, vectors)])
+    _validate_equal_lengths(vectors)
+
+    d = len(vectors[0])
+    if n <= _UNROLL_MAX_VECTORS and d < _NUMPY_MIN_DIM:
+        return _make_linear_combination(d, n)(scalars, vectors)
 
+    scalars = np.asarray(scalars, dtype=np.float64)
+    return tuple((scalars @ np.asarray(vectors, dtype=np.float64)).tolist())
 
-def unit(v: tuple[IntOrFloat, IntOrFloat, IntOrFloat]):
+
+def unit(v: tuple[float, float, float]):
     """Returns a vector whose length is one that is oriented in the same
     direction as the one given."""
-    return scale(1.0 / length(v), v)
+    if len(v) == 3:
+        return _unit3(v)
+
+    return scale(_inv_length(v), v)
+
+
+def unit_batched(x: np.ndarray) -> np.ndarray:
+    """Calculates the unit vectors oriented in the same direction as each of
+    the given vectors in a single vectorized operation.
+
+    Args:
+        x (np.ndarray): array of shape (n, d) holding one vector per row,
+            designated by its Cartesian coordinates.
+
+    Raises:
+        ZeroDivisionError: If any of the vectors has zero length, as unit does.
+
+    Returns:
+        np.ndarray: array of shape (n, d) with the unit vector of each row.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    lengths = length_batched(x)
+    if (lengths == 0).any():
+        raise ZeroDivisionError("float division by zero")
+    return x / lengths[..., np.newaxis]
+
 
+def _inv_length(v) -> float:
+    """Returns the reciprocal of the length of the given vector."""
+    return 1.0 / hypot(*v)
 
-def _same_size(*vectors) -> bool:
-    """Returns True if all the given vectors are of the same size,
-    False otherwise.
+
+def _validate_equal_lengths(vectors) -> None:
+    """Raises a TypeError if the given vectors are not all of the same size.
+    The length differences are OR-ed together instead of exiting early on the
+    first mismatch.
+    """
+    first = len(vectors[0])
+    acc = 0
+    for v in vectors:
+        acc |= len(v) ^ first
+    if acc:
+        raise TypeError("Size of the vectors must be same")
+
+
+# Unchecked version of add for three 3D vectors, for callers that already
+# know the shape of their inputs.
+def _add_triple(a, b, c):
+    return (
+        float(a[0] + b[0] + c[0]),
+        float(a[1] + b[1] + c[1]),
+        float(a[2] + b[2] + c[2]),
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_add(d: int, n: int):
+    """Generates a function that adds n vectors of size d using straight-line
+    code with no loops, e.g. for d=2 and n=3:
+    def add_2d_3v(v0, v1, v2):
+        return (float(v0[0] + v1[0] + v2[0]), float(v0[1] + ...), )
     """
-    return all(
-        [
-            len(vectors[i]) == len(vectors[(i + 1) % len(vectors)])
-            for i in range(len(vectors))
-        ]
+    args = ", ".join(f"v{j}" for j in range(n))
+    coords = "".join(
+        "float(" + " + ".join(f"v{j}[{i}]" for j in range(n)) + "), "
+        for i in range(d)
     )
+    namespace = {}
+    exec(  # pylint: disable=exec-used
+        f"def add_{d}d_{n}v({args}): return ({coords})", namespace
+    )
+    return namespace[f"add_{d}d_{n}v"]
+
+
+@lru_cache(maxsize=None)
+def _make_linear_combination(d: int, n: int):
+    """Generates a function that computes the linear combination of n vectors
+    of size d using straight-line code with no loops, e.g. for d=2 and n=2:
+    def linear_combination_2d_2v(s, v):
+        return (float(s[0] * v[0][0] + s[1] * v[1][0]), float(...), )
+    """
+    coords = "".join(
+        "float("
+        + " + ".join(f"s[{j}] * v[{j}][{i}]" for j in range(n))
+        + "), "
+        for i in range(d)
+    )
+    name = f"linear_combination_{d}d_{n}v"
+    namespace = {}
+    exec(  # pylint: disable=exec-used
+        f"def {name}(s, v): return ({coords})", namespace
+    )
+    return namespace[name]
+
+
+# Kernels for the common 3D case, used when the compiled extension is missing.
+# Their results are converted to float, as those of the compiled kernels are.
+def _add3_py(u, v):
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (float(ux + vx), float(uy + vy), float(uz + vz))
+
+
+def _sub3_py(u, v):
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (float(ux - vx), float(uy - vy), float(uz - vz))
+
+
+def _dot3_py(u, v):
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return float(ux * vx + uy * vy + uz * vz)
+
+
+def _dot4_py(u, v):
+    u0, u1, u2, u3 = u
+    v0, v1, v2, v3 = v
+    return float(u0 * v0 + u1 * v1 + u2 * v2 + u3 * v3)
+
+
+def _dotn_py(u, v):
+    return float(sum((coord_u * coord_v) for coord_u, coord_v in zip(u, v)))
+
+
+def _cross3_py(u, v):
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (
+        float(uy * vz - uz * vy),
+        float(uz * vx - ux * vz),
+        float(ux * vy - uy * vx),
+    )
+
+
+def _unit3_py(v):
+    x, y, z = v
+    inv = 1.0 / hypot(x, y, z)
+    return (inv * x, inv * y, inv * z)
+
+
+# The compiled extension is optional: use the kernels above when it's missing
+try:
+    from vec3d.math._math_c import add3 as _add3
+    from vec3d.math._math_c import cross3 as _cross3
+    from vec3d.math._math_c import dot3 as _dot3
+    from vec3d.math._math_c import dot4 as _dot4
+    from vec3d.math._math_c import dotn as _dotn
+    from vec3d.math._math_c import sub3 as _sub3
+    from vec3d.math._math_c import unit3 as _unit3
+except ImportError:
+    _add3, _dot3, _sub3 = _add3_py, _dot3_py, _sub3_py
+    _dot4, _dotn = _dot4_py, _dotn_py
+    _cross3, _unit3 = _cross3_py, _unit3_py
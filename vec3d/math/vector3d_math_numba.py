@@ -0,0 +1,80 @@
+"""
+Numba-compiled versions of the vec3d.math functions for callers that invoke
+them in hot loops. This module is optional and requires Numba to be installed.
+
+The functions take contiguous float64 NumPy arrays instead of tuples, which is
+what lets Numba compile them without boxing and vectorize the loops. They are
+compiled with explicit signatures, so the compilation happens (or is loaded
+from the cache) when the module is imported rather than on the first call.
+If Intel's SVML is available (the icc_rt package is installed, which can be
+checked with numba.config.USING_SVML), Numba also vectorizes the transcendental
+functions such as the acos in angle_between_nb.
+"""
+from math import acos, sqrt
+
+import numpy as np
+from numba import njit
+
+# Only the fast-math flags that allow fusing and reordering the floating point
+# operations, which is what lets the loops vectorize. The other flags assume
+# there are no nans or infinities, which breaks their propagation.
+_FASTMATH = {"contract", "reassoc"}
+
+
+@njit("f8(f8[::1], f8[::1])", fastmath=_FASTMATH, cache=True)
+def dot_nb(u: np.ndarray, v: np.ndarray) -> float:
+    """Calculates the dot product of the vectors u and v, given as contiguous
+    float64 arrays of the same size.
+    """
+    if u.shape[0] != v.shape[0]:
+        raise TypeError("Size of the vectors must be same")
+
+    result = 0.0
+    for i in range(u.shape[0]):
+        result += u[i] * v[i]
+    return result
+
+
+@njit("f8[::1](f8[::1], f8[::1])", fastmath=_FASTMATH, cache=True)
+def cross_nb(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Calculates the cross product of the 3D vectors u and v, given as
+    contiguous float64 arrays.
+    """
+    if u.shape[0] != 3 or v.shape[0] != 3:
+        raise TypeError("Cross product is only defined for 3D vectors")
+
+    result = np.empty(3)
+    result[0] = u[1] * v[2] - u[2] * v[1]
+    result[1] = u[2] * v[0] - u[0] * v[2]
+    result[2] = u[0] * v[1] - u[1] * v[0]
+    return result
+
+
+@njit("f8(f8[::1])", fastmath=_FASTMATH, cache=True)
+def length_nb(v: np.ndarray) -> float:
+    """Calculates the length of the vector v, given as a contiguous float64
+    array.
+    """
+    return sqrt(dot_nb(v, v))
+
+
+@njit("f8[::1](f8[::1])", fastmath=_FASTMATH, cache=True)
+def unit_nb(v: np.ndarray) -> np.ndarray:
+    """Returns a vector whose length is one that is oriented in the same
+    direction as the vector v, given as a contiguous float64 array.
+    """
+    return v * (1.0 / length_nb(v))
+
+
+@njit("f8(f8[::1], f8[::1])", fastmath=_FASTMATH, cache=True)
+def angle_between_nb(u: np.ndarray, v: np.ndarray) -> float:
+    """Calculates the angle between the vectors u and v, given as contiguous
+    float64 arrays, expressed in radians.
+    """
+    # The cosine is clamped to [-1, 1] as in angle_between, letting nan through
+    cos_angle = dot_nb(u, v) / (length_nb(u) * length_nb(v))
+    if cos_angle > 1.0:
+        cos_angle = 1.0
+    elif cos_angle < -1.0:
+        cos_angle = -1.0
+    return acos(cos_angle)